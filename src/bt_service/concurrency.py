@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from bt_service.settings import Settings
+
+
+class ConcurrencyLimitError(RuntimeError):
+    pass
+
+
+class ConcurrencySlot:
+    __slots__ = ("overloaded",)
+
+    def __init__(self) -> None:
+        self.overloaded = False
+
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(
+        self,
+        *,
+        min_limit: int,
+        max_limit: int,
+        target_latency_ms: float,
+        queue_timeout_seconds: float,
+        window_size: int = 20,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+    ) -> None:
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("Concurrency limits must satisfy 1 <= min_limit <= max_limit.")
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._target_latency_ms = target_latency_ms
+        self._queue_timeout_seconds = queue_timeout_seconds
+        self._increase_step = increase_step
+        self._decrease_factor = decrease_factor
+        self._limit = float(max_limit)
+        self._in_flight = 0
+        self._latencies: deque[float] = deque(maxlen=window_size)
+        self._completions_since_decrease = max_limit
+        self._condition = asyncio.Condition()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> AdaptiveConcurrencyLimiter:
+        return cls(
+            min_limit=settings.tool_min_concurrency,
+            max_limit=settings.tool_max_concurrency,
+            target_latency_ms=settings.tool_target_latency_ms,
+            queue_timeout_seconds=settings.tool_queue_timeout_seconds,
+        )
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[ConcurrencySlot]:
+        async with self._condition:
+            try:
+                await asyncio.wait_for(
+                    self._condition.wait_for(lambda: self._in_flight < self.limit),
+                    timeout=self._queue_timeout_seconds,
+                )
+            except TimeoutError as exc:
+                raise ConcurrencyLimitError(
+                    f"Concurrency limit reached ({self.limit} running)."
+                ) from exc
+            self._in_flight += 1
+
+        slot = ConcurrencySlot()
+        started = time.perf_counter()
+        try:
+            yield slot
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            async with self._condition:
+                self._in_flight -= 1
+                self._record_completion(elapsed_ms, slot.overloaded)
+                self._condition.notify_all()
+
+    # Additive increase of ~increase_step per `limit` completions while the rolling
+    # mean latency is within target; otherwise (or when the caller marked the slot
+    # overloaded) one multiplicative decrease.
+    def _record_completion(self, elapsed_ms: float, overloaded: bool) -> None:
+        self._latencies.append(elapsed_ms)
+        self._completions_since_decrease += 1
+        mean_latency_ms = sum(self._latencies) / len(self._latencies)
+        if overloaded or mean_latency_ms > self._target_latency_ms:
+            self._decrease()
+            return
+        self._limit = min(
+            float(self._max_limit),
+            self._limit + self._increase_step / self._limit,
+        )
+
+    def _decrease(self) -> None:
+        # At most one decrease per `limit` completions, so a burst of slow runs
+        # (e.g. from a single client) costs one step rather than one per run.
+        if self._completions_since_decrease < self._limit:
+            return
+        self._limit = max(float(self._min_limit), self._limit * self._decrease_factor)
+        self._completions_since_decrease = 0
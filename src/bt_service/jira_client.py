@@ -1,17 +1,46 @@
 from __future__ import annotations
 
 import base64
+import json
+import math
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
+import orjson
 
 from bt_service.settings import Settings
 
 
+def _contains_non_finite(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_contains_non_finite(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_contains_non_finite(item) for item in value)
+    return False
+
+
+def _dumps(body: dict[str, Any]) -> bytes:
+    # orjson writes NaN/Infinity as null, which would clear the field in Jira.
+    if _contains_non_finite(body):
+        raise JiraPayloadError("Jira fields must not contain NaN or Infinity.")
+    try:
+        return orjson.dumps(body)
+    except orjson.JSONEncodeError:
+        # orjson rejects integers outside 64 bits, which the request model accepts.
+        return json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 class JiraConfigError(RuntimeError):
     pass
 
 
+class JiraPayloadError(ValueError):
+    pass
+
+
 class JiraApiError(RuntimeError):
     def __init__(self, action: str, status_code: int, detail: str) -> None:
         super().__init__(f"Jira {action} failed ({status_code}): {detail}")
@@ -20,9 +49,59 @@ class JiraApiError(RuntimeError):
         self.detail = detail
 
 
+@dataclass(frozen=True, slots=True)
+class JiraRuntimeConfig:
+    base_url: str
+    timeout: httpx.Timeout
+    verify: bool
+    headers: dict[str, str]
+    configured: bool
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> JiraRuntimeConfig:
+        user_email = settings.resolved_jira_user_email
+        api_token = settings.resolved_jira_api_token
+        headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+        if user_email and api_token:
+            credential_raw = f"{user_email}:{api_token}"
+            basic_token = base64.b64encode(credential_raw.encode("utf-8")).decode("ascii")
+            headers["Authorization"] = f"Basic {basic_token}"
+        return cls(
+            base_url=settings.resolved_jira_base_url or "",
+            timeout=httpx.Timeout(settings.jira_timeout_seconds),
+            verify=settings.jira_verify_ssl,
+            headers=headers,
+            configured=settings.jira_is_configured,
+        )
+
+
+def create_http_client(config: JiraRuntimeConfig) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=config.base_url,
+        timeout=config.timeout,
+        verify=config.verify,
+        trust_env=True,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+    )
+
+
 class JiraClient:
-    def __init__(self, settings: Settings) -> None:
-        self._settings = settings
+    def __init__(self, config: JiraRuntimeConfig, http_client: httpx.AsyncClient) -> None:
+        self._config = config
+        self._http_client = http_client
+
+    async def warm_up(self) -> None:
+        if not self._config.configured:
+            return
+        response = await self._http_client.get(
+            "/rest/api/2/serverInfo",
+            headers=self._config.headers,
+        )
+        self._raise_for_status(response, "server info")
 
     async def update_issue(
         self,
@@ -30,44 +109,38 @@ class JiraClient:
         fields: dict[str, Any],
         comment: str | None,
     ) -> dict[str, Any]:
-        base_url = self._settings.resolved_jira_base_url
-        if not self._settings.jira_is_configured:
+        if not self._config.configured:
             raise JiraConfigError(
                 "Jira is not configured. Set BT_JIRA_BASE_URL/BT_JIRA_*_<ENV>, "
                 "BT_JIRA_USER_EMAIL/BT_JIRA_USER_EMAIL_<ENV>, "
                 "BT_JIRA_API_TOKEN/BT_JIRA_API_TOKEN_<ENV>."
             )
-        if not base_url:
-            raise JiraConfigError("Jira base URL is empty after environment resolution.")
-
-        timeout = httpx.Timeout(self._settings.jira_timeout_seconds)
-        async with httpx.AsyncClient(
-            base_url=base_url,
-            timeout=timeout,
-            verify=self._settings.jira_verify_ssl,
-            trust_env=True,
-        ) as client:
-            headers = self._build_headers()
-            fields_updated = False
-            comment_added = False
-
-            if fields:
-                response = await client.put(
-                    f"/rest/api/2/issue/{issue_key}",
-                    json={"fields": fields},
-                    headers=headers,
-                )
-                self._raise_for_status(response, "field update")
-                fields_updated = True
 
+        client = self._http_client
+        headers = self._config.headers
+        fields_updated = False
+        comment_added = False
+
+        if fields:
+            body: dict[str, Any] = {"fields": fields}
             if comment:
-                response = await client.post(
-                    f"/rest/api/2/issue/{issue_key}/comment",
-                    json={"body": comment},
-                    headers=headers,
-                )
-                self._raise_for_status(response, "comment update")
-                comment_added = True
+                body["update"] = {"comment": [{"add": {"body": comment}}]}
+            response = await client.put(
+                f"/rest/api/2/issue/{issue_key}",
+                content=_dumps(body),
+                headers=headers,
+            )
+            self._raise_for_status(response, "issue update" if comment else "field update")
+            fields_updated = True
+            comment_added = bool(comment)
+        elif comment:
+            response = await client.post(
+                f"/rest/api/2/issue/{issue_key}/comment",
+                content=_dumps({"body": comment}),
+                headers=headers,
+            )
+            self._raise_for_status(response, "comment update")
+            comment_added = True
 
         return {
             "issue_key": issue_key,
@@ -75,19 +148,6 @@ class JiraClient:
             "comment_added": comment_added,
         }
 
-    def _build_headers(self) -> dict[str, str]:
-        user_email = self._settings.resolved_jira_user_email
-        api_token = self._settings.resolved_jira_api_token
-        if not user_email or not api_token:
-            raise JiraConfigError("Jira credentials are empty after environment resolution.")
-        credential_raw = f"{user_email}:{api_token}"
-        basic_token = base64.b64encode(credential_raw.encode("utf-8")).decode("ascii")
-        return {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "Authorization": f"Basic {basic_token}",
-        }
-
     @staticmethod
     def _raise_for_status(response: httpx.Response, action: str) -> None:
         if response.status_code >= 400:
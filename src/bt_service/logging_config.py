@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import copy
 import json
 import logging
-from datetime import UTC, datetime
+import time
 from typing import Any
 
+import orjson
 from uvicorn.config import LOGGING_CONFIG
 
 from bt_service.settings import Settings
@@ -15,16 +15,37 @@ APP_LOGGER_NAME = "bt_service"
 
 
 class JsonLogFormatter(logging.Formatter):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._second_prefix: tuple[int, str] = (-1, "")
+
     def format(self, record: logging.LogRecord) -> str:
         payload: dict[str, Any] = {
-            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
         if record.exc_info:
             payload["exception"] = self.formatException(record.exc_info)
-        return json.dumps(payload, ensure_ascii=False)
+        try:
+            return orjson.dumps(payload).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # orjson rejects lone surrogates (e.g. surrogateescape'd paths).
+            return json.dumps(payload, ensure_ascii=False)
+
+    def _format_timestamp(self, created: float) -> str:
+        second = int(created)
+        # Round like datetime.fromtimestamp does, carrying into the next second.
+        microsecond = round((created - second) * 1_000_000)
+        if microsecond == 1_000_000:
+            second += 1
+            microsecond = 0
+        cached_second, prefix = self._second_prefix
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_prefix = (second, prefix)
+        return f"{prefix}.{microsecond:06d}+00:00"
 
 
 def get_app_logger() -> logging.Logger:
@@ -71,8 +92,17 @@ def build_uvicorn_log_config(settings: Settings) -> dict[str, Any] | None:
     if settings.resolved_log_json:
         return None
 
-    log_config: dict[str, Any] = copy.deepcopy(LOGGING_CONFIG)
-    formatters = log_config.setdefault("formatters", {})
+    # Only the formatter and logger entries are modified below, so copying
+    # those two levels is enough to keep uvicorn's LOGGING_CONFIG untouched.
+    formatters = {
+        name: dict(value) for name, value in LOGGING_CONFIG.get("formatters", {}).items()
+    }
+    loggers = {name: dict(value) for name, value in LOGGING_CONFIG.get("loggers", {}).items()}
+    log_config: dict[str, Any] = {
+        **LOGGING_CONFIG,
+        "formatters": formatters,
+        "loggers": loggers,
+    }
     default_formatter = formatters.get("default")
     if isinstance(default_formatter, dict):
         default_formatter["fmt"] = "%(asctime)s %(levelprefix)s %(message)s"
@@ -83,7 +113,6 @@ def build_uvicorn_log_config(settings: Settings) -> dict[str, Any] | None:
             '"%(request_line)s" %(status_code)s'
         )
 
-    loggers = log_config.setdefault("loggers", {})
     for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
         logger_config = loggers.get(name)
         if isinstance(logger_config, dict):
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
-import json
 import os
+import re
+import sys
 from contextlib import asynccontextmanager
 from typing import Any
 
+import httpx
+import orjson
 import uvicorn
-from anyio.to_thread import run_sync
-from fastapi import APIRouter, Depends, FastAPI, HTTPException
-
-from bt_service.jira_client import JiraApiError, JiraClient, JiraConfigError
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request, Response
+
+from bt_service.concurrency import AdaptiveConcurrencyLimiter, ConcurrencyLimitError
+from bt_service.jira_client import (
+    JiraApiError,
+    JiraClient,
+    JiraConfigError,
+    JiraPayloadError,
+    JiraRuntimeConfig,
+    create_http_client,
+)
 from bt_service.logging_config import (
     build_uvicorn_log_config,
     configure_logging,
@@ -31,24 +41,52 @@ from bt_service.settings import Settings, get_settings
 
 logger = get_app_logger()
 
-
-def _apply_proxy_environment() -> None:
-    settings = get_settings()
-    proxy_env = settings.proxy_env()
-    for key, value in proxy_env.items():
-        os.environ[key] = value
+_JSON_LEADING_WS_RE = re.compile(rb"[ \t\r\n]*")
+
+# The 200 body is either ToolExecutionResponse or, with raw=true, the tool's own
+# JSON document; declared here because response_model can only describe one.
+_HCI_FILTER_OK_RESPONSE: dict[str, Any] = {
+    "model": ToolExecutionResponse | dict[str, Any] | list[Any],
+    "description": "ToolExecutionResponse, or with raw=true the tool's stdout as-is.",
+    "headers": {
+        "X-Exit-Code": {
+            "description": "Tool exit code (raw=true only).",
+            "schema": {"type": "integer"},
+        },
+        "X-Duration-Ms": {
+            "description": "Tool run time in milliseconds (raw=true only).",
+            "schema": {"type": "integer"},
+        },
+    },
+}
+
+
+def _apply_proxy_environment(settings: Settings) -> None:
+    changed = {
+        key: value
+        for key, value in settings.proxy_env.items()
+        if os.environ.get(key) != value
+    }
+    if changed:
+        os.environ.update(changed)
 
 
-def _try_parse_json(text: str) -> Any | None:
-    content = text.strip()
-    if not content:
-        raise ValueError("Tool stdout is empty. JSON output is required.")
+def _try_parse_json(content: bytes) -> Any | None:
+    _require_json_document(content)
     try:
-        return json.loads(content)
-    except json.JSONDecodeError:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
         raise ValueError("Tool stdout must be valid JSON.")
 
 
+def _require_json_document(content: bytes) -> None:
+    start = _JSON_LEADING_WS_RE.match(content).end()
+    if start == len(content):
+        raise ValueError("Tool stdout is empty. JSON output is required.")
+    if content[start] not in b"{[":
+        raise ValueError("Tool stdout must be a JSON object or array.")
+
+
 def _tool_failure_http_exception(result: ProcessResult) -> HTTPException:
     detail = {
         "message": "Tool execution failed.",
@@ -60,8 +98,20 @@ def _tool_failure_http_exception(result: ProcessResult) -> HTTPException:
     return HTTPException(status_code=502, detail=detail)
 
 
+def get_jira_client(request: Request) -> JiraClient:
+    return request.app.state.jira_client
+
+
+def get_runner(request: Request) -> ProcessRunner:
+    return request.app.state.runner
+
+
+def get_tool_limiter(request: Request) -> AdaptiveConcurrencyLimiter:
+    return request.app.state.tool_limiter
+
+
 @asynccontextmanager
-async def lifespan(_: FastAPI):
+async def lifespan(app: FastAPI):
     settings = get_settings()
     configure_logging(settings)
     logger.info(
@@ -72,9 +122,24 @@ async def lifespan(_: FastAPI):
         settings.resolved_log_json,
         settings.log_uvicorn_access,
     )
-    _apply_proxy_environment()
-    settings.resolved_tool_bin_dir.mkdir(parents=True, exist_ok=True)
-    yield
+    _apply_proxy_environment(settings)
+    runner = ProcessRunner(settings)
+    runner.ensure_bin_dir()
+    app.state.runner = runner
+    app.state.tool_limiter = AdaptiveConcurrencyLimiter.from_settings(settings)
+    jira_config = JiraRuntimeConfig.from_settings(settings)
+    jira_http_client = create_http_client(jira_config)
+    jira_client = JiraClient(jira_config, jira_http_client)
+    app.state.jira_client = jira_client
+    if settings.jira_warmup_on_startup:
+        try:
+            await jira_client.warm_up()
+        except (httpx.HTTPError, JiraApiError) as exc:
+            logger.warning("jira_warmup failed error=%s", str(exc))
+    try:
+        yield
+    finally:
+        await jira_http_client.aclose()
 
 
 def create_app() -> FastAPI:
@@ -88,18 +153,23 @@ def create_app() -> FastAPI:
     api = APIRouter(prefix=settings.api_prefix)
 
     @api.get("/health", tags=["health"])
-    async def health() -> dict[str, str]:
-        current = get_settings()
+    async def health(current: Settings = Depends(get_settings)) -> dict[str, str]:
         return {"status": "ok", "app": current.app_name, "env": current.app_env}
 
-    @api.post("/tools/hci/filter", tags=["tools"], response_model=ToolExecutionResponse)
+    @api.post(
+        "/tools/hci/filter",
+        tags=["tools"],
+        response_model=None,
+        responses={200: _HCI_FILTER_OK_RESPONSE},
+    )
     async def hci_filter(
         payload: HciFilterRequest,
         current: Settings = Depends(get_settings),
-    ) -> ToolExecutionResponse:
+        runner: ProcessRunner = Depends(get_runner),
+        limiter: AdaptiveConcurrencyLimiter = Depends(get_tool_limiter),
+        raw: bool = False,
+    ) -> Response:
         logger.info("hci_filter request input_path=%s", payload.input_path)
-        runner = ProcessRunner(current)
-        runner.ensure_bin_dir()
 
         args = ["hci", "filter", "--mode", "json", "-o", "stdout"]
         if payload.ogf:
@@ -118,13 +188,23 @@ def create_app() -> FastAPI:
         args.append(payload.input_path)
 
         try:
-            result = await run_sync(
-                runner.run,
-                current.tool_hci_filter_executable,
-                args,
-                payload.timeout_seconds,
-                current.tool_hci_filter_working_dir,
-            )
+            async with limiter.acquire() as slot:
+                result = await runner.run_async(
+                    current.tool_hci_filter_executable,
+                    args,
+                    payload.timeout_seconds,
+                    current.tool_hci_filter_working_dir,
+                )
+                # Only a timeout says the host is overloaded; a fast failure is usually
+                # bad input, which must not let one client shrink the shared limit.
+                slot.overloaded = result.timed_out
+        except ConcurrencyLimitError as exc:
+            logger.warning("hci_filter rejected limit=%s", limiter.limit)
+            raise HTTPException(
+                status_code=503,
+                detail=str(exc),
+                headers={"Retry-After": "1"},
+            ) from exc
         except ExecutableNotFoundError as exc:
             raise HTTPException(status_code=404, detail=str(exc)) from exc
         except UnsafeExecutablePathError as exc:
@@ -140,14 +220,30 @@ def create_app() -> FastAPI:
             )
             raise _tool_failure_http_exception(result)
 
+        if raw:
+            try:
+                _require_json_document(result.stdout_bytes)
+            except ValueError as exc:
+                logger.error("hci_filter invalid_json_stdout")
+                raise HTTPException(status_code=502, detail=str(exc)) from exc
+            logger.info("hci_filter success raw duration_ms=%s", result.duration_ms)
+            return Response(
+                content=result.stdout_bytes,
+                media_type="application/json",
+                headers={
+                    "X-Exit-Code": str(result.exit_code),
+                    "X-Duration-Ms": str(result.duration_ms),
+                },
+            )
+
         try:
-            output = _try_parse_json(result.stdout)
+            output = _try_parse_json(result.stdout_bytes)
         except ValueError as exc:
             logger.error("hci_filter invalid_json_stdout")
             raise HTTPException(status_code=502, detail=str(exc)) from exc
 
         logger.info("hci_filter success duration_ms=%s", result.duration_ms)
-        return ToolExecutionResponse(
+        response = ToolExecutionResponse(
             executable=current.tool_hci_filter_executable,
             command=result.command,
             exit_code=result.exit_code,
@@ -155,14 +251,16 @@ def create_app() -> FastAPI:
             stderr=result.stderr,
             duration_ms=result.duration_ms,
         )
+        # Without a response_model (see _HCI_FILTER_OK_RESPONSE) FastAPI would fall
+        # back to jsonable_encoder; serialize with Pydantic directly instead.
+        return Response(content=response.model_dump_json(), media_type="application/json")
 
     @api.post("/jira/issues/update", tags=["jira"], response_model=JiraIssueUpdateResponse)
     async def update_issue(
         payload: JiraIssueUpdateRequest,
-        current: Settings = Depends(get_settings),
+        client: JiraClient = Depends(get_jira_client),
     ) -> JiraIssueUpdateResponse:
         logger.info("jira_update request issue_key=%s", payload.issue_key)
-        client = JiraClient(current)
 
         try:
             result = await client.update_issue(
@@ -173,6 +271,8 @@ def create_app() -> FastAPI:
         except JiraConfigError as exc:
             logger.error("jira_update config_error=%s", str(exc))
             raise HTTPException(status_code=500, detail=str(exc)) from exc
+        except JiraPayloadError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
         except JiraApiError as exc:
             logger.error("jira_update api_error=%s", str(exc))
             raise HTTPException(status_code=502, detail=str(exc)) from exc
@@ -198,6 +298,7 @@ def run() -> None:
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.resolved_api_reload,
+        loop="auto" if sys.platform == "win32" else "uvloop",
         access_log=settings.log_uvicorn_access,
         log_level=settings.resolved_log_level.lower(),
         log_config=uvicorn_log_config,
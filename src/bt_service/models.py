@@ -26,7 +26,7 @@ class ToolExecutionResponse(BaseModel):
 
 
 class JiraIssueUpdateRequest(BaseModel):
-    issue_key: str = Field(min_length=3, max_length=32, pattern=r"^[A-Za-z][A-Za-z0-9]+-\d+$")
+    issue_key: str = Field(min_length=3, max_length=32, pattern=r"^[A-Za-z][A-Za-z0-9]+-[0-9]+$")
     fields: dict[str, Any] = Field(default_factory=dict)
     comment: str | None = None
 
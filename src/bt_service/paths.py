@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os
-from functools import lru_cache
 from pathlib import Path
 
 
@@ -21,16 +20,21 @@ def discover_project_root(start: Path | None = None) -> Path:
     return Path.cwd().expanduser().resolve()
 
 
-@lru_cache(maxsize=1)
+_project_root: Path | None = None
+
+
 def get_project_root() -> Path:
-    return discover_project_root()
+    global _project_root
+    if _project_root is None:
+        _project_root = discover_project_root()
+    return _project_root
 
 
 def resolve_from_root(path_value: str | Path) -> Path:
     path = Path(path_value).expanduser()
     if path.is_absolute():
         return path.resolve()
-    return (get_project_root() / path).resolve()
+    return ((_project_root or get_project_root()) / path).resolve()
 
 
 def is_within(parent: Path, candidate: Path) -> bool:
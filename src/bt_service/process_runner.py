@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import os
 import re
+import signal
+import stat
 import subprocess
 import time
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
-from bt_service.paths import is_within, resolve_from_root
+from bt_service.paths import resolve_from_root
 from bt_service.settings import Settings
 
 
@@ -23,18 +31,75 @@ class UnsafeExecutablePathError(ValueError):
 class ProcessResult:
     command: list[str]
     exit_code: int
-    stdout: str
+    stdout_bytes: bytes
     stderr: str
     duration_ms: int
+    timed_out: bool = False
 
+    # Decoded on demand so the JSON path only ever holds the captured bytes.
+    @property
+    def stdout(self) -> str:
+        return self.stdout_bytes.decode("utf-8", errors="replace")
+
+
+# After a timeout kill, a grandchild can keep the pipes open; cap how long we drain.
+_KILL_DRAIN_TIMEOUT_SECONDS = 2.0
+_ANSI_ESCAPE_RE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]", re.ASCII)
+# Same pattern on the raw UTF-8 stdout; it only matches ASCII bytes, which never
+# occur inside a multi-byte UTF-8 sequence.
+_ANSI_ESCAPE_BYTES_RE = re.compile(rb"\x1B\[[0-?]*[ -/]*[@-~]")
+
+
+def _strip_ansi(value: str) -> str:
+    if "\x1b" not in value:
+        return value
+    return _ANSI_ESCAPE_RE.sub("", value)
+
+
+def _strip_ansi_bytes(value: bytes) -> bytes:
+    if b"\x1b" not in value:
+        return value
+    return _ANSI_ESCAPE_BYTES_RE.sub(b"", value)
 
-_ANSI_ESCAPE_RE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
+
+def _kill_process_group(process: subprocess.Popen[bytes] | asyncio.subprocess.Process) -> None:
+    # Tools run in their own session (POSIX), so this also kills grandchildren
+    # that inherited the pipes and would otherwise keep them open.
+    with contextlib.suppress(ProcessLookupError, PermissionError):
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+
+
+def _keep_output(value: str) -> str:
+    return value
+
+
+def _keep_output_bytes(value: bytes) -> bytes:
+    return value
 
 
 class ProcessRunner:
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
-        self._bin_dir = settings.resolved_tool_bin_dir
+        # Resolved once so containment checks below are plain string prefix
+        # comparisons against realpath() output.
+        self._bin_dir = settings.resolved_tool_bin_dir.resolve()
+        self._bin_dir_str = str(self._bin_dir)
+        self._bin_dir_prefix = os.path.join(self._bin_dir_str, "")
+        self._default_timeout = settings.tool_default_timeout_seconds
+        self._project_root = settings.project_root
+        self._resolve_cached = lru_cache(maxsize=128)(self._resolve_uncached)
+        # Settings do not change after startup, so the child environment is
+        # built once (None when there is nothing to override).
+        self._env = self._build_env()
+        if settings.tool_strip_ansi_output:
+            self._sanitize_output = _strip_ansi
+            self._sanitize_stdout = _strip_ansi_bytes
+        else:
+            self._sanitize_output = _keep_output
+            self._sanitize_stdout = _keep_output_bytes
 
     @property
     def bin_dir(self) -> Path:
@@ -44,17 +109,78 @@ class ProcessRunner:
         self._bin_dir.mkdir(parents=True, exist_ok=True)
 
     def resolve_executable(self, executable: str) -> Path:
-        raw_target = Path(executable)
-        candidate = raw_target if raw_target.is_absolute() else self._bin_dir / raw_target
-        resolved = candidate.expanduser().resolve()
+        return self._resolve(executable)[0]
+
+    def _resolve(self, executable: str) -> tuple[Path, str]:
+        # Entries are keyed by the bin dir mtime, so adding/removing/renaming
+        # tools there invalidates them. Deeper changes to a symlink-free path
+        # are caught by _is_unchanged; a path that went through a symlink is
+        # resolved again on every call, since the link can be retargeted.
+        try:
+            bin_dir_mtime_ns = os.stat(self._bin_dir_str).st_mtime_ns
+        except OSError:
+            bin_dir_mtime_ns = -1
+        resolved, resolved_str, direct = self._resolve_cached(executable, bin_dir_mtime_ns)
+        if not direct:
+            resolved, resolved_str, _ = self._resolve_uncached(executable, bin_dir_mtime_ns)
+        elif not self._is_unchanged(resolved_str):
+            self._resolve_cached.cache_clear()
+            resolved, resolved_str, _ = self._resolve_cached(executable, bin_dir_mtime_ns)
+        return resolved, resolved_str
+
+    def _is_unchanged(self, resolved_str: str) -> bool:
+        # A direct entry is the requested path itself, with no symlinks below the
+        # bin dir when it was resolved. Re-check that with lstat() on just those
+        # components (cheaper than a full realpath()), so a file or directory
+        # swapped for a symlink since then is resolved (and rejected) again.
+        path = self._bin_dir_str
+        parts = resolved_str[len(self._bin_dir_prefix):].split(os.sep)
+        for index, part in enumerate(parts):
+            path = os.path.join(path, part)
+            try:
+                mode = os.lstat(path).st_mode
+            except OSError:
+                return False
+            expected = stat.S_ISREG if index == len(parts) - 1 else stat.S_ISDIR
+            if not expected(mode):
+                return False
+        return True
 
-        if not is_within(self._bin_dir, resolved):
+    def _resolve_uncached(
+        self, executable: str, _bin_dir_mtime_ns: int
+    ) -> tuple[Path, str, bool]:
+        # A bare file name that is a regular file (not a symlink) in the resolved
+        # bin dir cannot point outside it, so realpath() and the containment check can be skipped.
+        if executable and os.path.basename(executable) == executable:
+            candidate = os.path.join(self._bin_dir_str, executable)
+            try:
+                is_regular_file = stat.S_ISREG(os.lstat(candidate).st_mode)
+            except OSError:
+                is_regular_file = False
+            if is_regular_file:
+                return Path(candidate), candidate, True
+
+        # os.path.join keeps an absolute executable as-is.
+        candidate = os.path.expanduser(os.path.join(self._bin_dir_str, executable))
+        resolved_str = os.path.realpath(candidate)
+        resolved = Path(resolved_str)
+
+        if not (
+            resolved_str.startswith(self._bin_dir_prefix) or resolved_str == self._bin_dir_str
+        ):
             raise UnsafeExecutablePathError(
                 f"Executable must be inside the configured bin directory: {self._bin_dir}"
             )
-        if not resolved.exists() or not resolved.is_file():
+        try:
+            is_regular_file = stat.S_ISREG(os.stat(resolved_str).st_mode)
+        except OSError:
+            is_regular_file = False
+        if not is_regular_file:
             raise ExecutableNotFoundError(f"Executable not found: {resolved}")
-        return resolved
+        # Direct: no symlink and no ".." was involved, so the target is the
+        # requested path itself.
+        direct = resolved_str == candidate and ".." not in Path(executable).parts
+        return resolved, resolved_str, direct
 
     def run(
         self,
@@ -63,66 +189,179 @@ class ProcessRunner:
         timeout_seconds: int | None = None,
         working_dir: str | None = None,
     ) -> ProcessResult:
-        target = self.resolve_executable(executable)
-        timeout = timeout_seconds or self._settings.tool_default_timeout_seconds
-
-        cwd = resolve_from_root(working_dir) if working_dir else self._settings.project_root
-        if not cwd.exists() or not cwd.is_dir():
-            raise ValueError(f"Invalid working directory: {cwd}")
-
-        command = [str(target), *args]
-        started = time.perf_counter()
+        command, cwd, timeout = self._prepare(executable, args, timeout_seconds, working_dir)
+        started = time.perf_counter_ns()
         try:
-            completed = subprocess.run(
+            process = subprocess.Popen(
                 command,
                 cwd=str(cwd),
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                check=False,
-                env=self._build_env(),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=self._env,
+                start_new_session=True,
             )
-        except subprocess.TimeoutExpired as exc:
-            elapsed = int((time.perf_counter() - started) * 1000)
-            stdout = self._to_text(exc.stdout)
-            stderr = self._to_text(exc.stderr) + f"\nProcess timed out after {timeout} seconds."
-            return ProcessResult(
-                command=command,
-                exit_code=124,
-                stdout=self._sanitize_output(stdout),
-                stderr=self._sanitize_output(stderr),
-                duration_ms=elapsed,
+        except FileNotFoundError as exc:
+            raise self._executable_vanished(command[0]) from exc
+
+        with process:
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                _kill_process_group(process)
+                try:
+                    stdout, stderr = process.communicate(timeout=_KILL_DRAIN_TIMEOUT_SECONDS)
+                except subprocess.TimeoutExpired as exc:
+                    stdout, stderr = exc.stdout, exc.stderr
+                return self._timeout_result(command, timeout, stdout, stderr, started)
+
+        return self._build_result(command, process.returncode, stdout, stderr, started)
+
+    # Runner state is read-only after __init__ and the resolve cache is lru_cache
+    # (thread-safe), so runs can share the runner across worker threads.
+    def run_many(self, specs: Sequence[Mapping[str, Any]]) -> list[ProcessResult]:
+        if not specs:
+            return []
+        max_workers = min(len(specs), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda spec: self.run(**spec), specs))
+
+    async def run_async(
+        self,
+        executable: str,
+        args: list[str],
+        timeout_seconds: int | None = None,
+        working_dir: str | None = None,
+    ) -> ProcessResult:
+        command, cwd, timeout = self._prepare(executable, args, timeout_seconds, working_dir)
+        started = time.perf_counter_ns()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=str(cwd),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=self._env,
+                start_new_session=True,
             )
+        except FileNotFoundError as exc:
+            raise self._executable_vanished(command[0]) from exc
+        # Output is read into buffers owned here rather than by communicate(),
+        # so a timeout cannot discard what the tool had already written.
+        stdout_chunks: list[bytes] = []
+        stderr_chunks: list[bytes] = []
+        io_task = asyncio.create_task(self._collect_output(process, stdout_chunks, stderr_chunks))
+        try:
+            done, _ = await asyncio.wait({io_task}, timeout=timeout)
+            if not done:
+                _kill_process_group(process)
+                done, _ = await asyncio.wait({io_task}, timeout=_KILL_DRAIN_TIMEOUT_SECONDS)
+                if not done:
+                    # Something outside the process group still holds the pipes;
+                    # keep what was read so far.
+                    io_task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await io_task
+                return self._timeout_result(
+                    command, timeout, b"".join(stdout_chunks), b"".join(stderr_chunks), started
+                )
+        except asyncio.CancelledError:
+            # The caller went away (e.g. client disconnect); do not leave the tool running.
+            io_task.cancel()
+            _kill_process_group(process)
+            raise
+
+        io_task.result()
+        return self._build_result(
+            command, process.returncode, b"".join(stdout_chunks), b"".join(stderr_chunks), started
+        )
+
+    @staticmethod
+    async def _collect_output(
+        process: asyncio.subprocess.Process,
+        stdout_chunks: list[bytes],
+        stderr_chunks: list[bytes],
+    ) -> None:
+        async def pump(stream: asyncio.StreamReader | None, chunks: list[bytes]) -> None:
+            if stream is None:
+                return
+            while chunk := await stream.read(65536):
+                chunks.append(chunk)
+
+        await asyncio.gather(
+            pump(process.stdout, stdout_chunks),
+            pump(process.stderr, stderr_chunks),
+            process.wait(),
+        )
+
+    def _prepare(
+        self,
+        executable: str,
+        args: list[str],
+        timeout_seconds: int | None,
+        working_dir: str | None,
+    ) -> tuple[list[str], Path, int]:
+        _, target = self._resolve(executable)
+        timeout = timeout_seconds or self._default_timeout
+
+        cwd = resolve_from_root(working_dir) if working_dir else self._project_root
+        if not cwd.exists() or not cwd.is_dir():
+            raise ValueError(f"Invalid working directory: {cwd}")
+
+        return [target, *args], cwd, timeout
+
+    def _executable_vanished(self, executable: str) -> ExecutableNotFoundError:
+        self._resolve_cached.cache_clear()
+        return ExecutableNotFoundError(f"Executable not found: {executable}")
+
+    def _build_result(
+        self,
+        command: list[str],
+        exit_code: int,
+        stdout_raw: bytes | None,
+        stderr_raw: bytes | None,
+        started: int,
+    ) -> ProcessResult:
+        elapsed = (time.perf_counter_ns() - started) // 1_000_000
+        return ProcessResult(
+            command=command,
+            exit_code=exit_code,
+            stdout_bytes=self._sanitize_stdout(stdout_raw or b""),
+            stderr=self._sanitize_output(
+                stderr_raw.decode("utf-8", errors="replace") if stderr_raw else ""
+            ),
+            duration_ms=elapsed,
+        )
 
-        elapsed = int((time.perf_counter() - started) * 1000)
+    def _timeout_result(
+        self,
+        command: list[str],
+        timeout: int,
+        stdout_raw: bytes | None,
+        stderr_raw: bytes | None,
+        started: int,
+    ) -> ProcessResult:
+        elapsed = (time.perf_counter_ns() - started) // 1_000_000
+        stderr = stderr_raw.decode("utf-8", errors="replace") if stderr_raw else ""
+        stderr += f"\nProcess timed out after {timeout} seconds."
         return ProcessResult(
             command=command,
-            exit_code=completed.returncode,
-            stdout=self._sanitize_output(completed.stdout),
-            stderr=self._sanitize_output(completed.stderr),
+            exit_code=124,
+            stdout_bytes=self._sanitize_stdout(stdout_raw or b""),
+            stderr=self._sanitize_output(stderr),
             duration_ms=elapsed,
+            timed_out=True,
         )
 
-    def _build_env(self) -> dict[str, str]:
-        env = os.environ.copy()
+    def _build_env(self) -> dict[str, str] | None:
+        overrides: dict[str, str] = {}
         if self._settings.proxy_apply_to_process:
-            env.update(self._settings.proxy_env())
+            overrides.update(self._settings.proxy_env)
         if self._settings.tool_force_no_color_env:
-            env["NO_COLOR"] = "1"
-            env["CLICOLOR"] = "0"
-            env["CLICOLOR_FORCE"] = "0"
-            env["TERM"] = "dumb"
-        return env
-
-    def _sanitize_output(self, value: str) -> str:
-        if not self._settings.tool_strip_ansi_output:
-            return value
-        return _ANSI_ESCAPE_RE.sub("", value)
-
-    @staticmethod
-    def _to_text(value: str | bytes | None) -> str:
-        if value is None:
-            return ""
-        if isinstance(value, bytes):
-            return value.decode("utf-8", errors="replace")
-        return value
+            overrides["NO_COLOR"] = "1"
+            overrides["CLICOLOR"] = "0"
+            overrides["CLICOLOR_FORCE"] = "0"
+            overrides["TERM"] = "dumb"
+        if not overrides:
+            # env=None lets the child inherit the parent environment directly.
+            return None
+        return {**os.environ, **overrides}
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from bt_service.paths import get_project_root, resolve_from_root
@@ -11,6 +11,7 @@ from bt_service.paths import get_project_root, resolve_from_root
 
 _PROJECT_ROOT = get_project_root()
 _ENV_FILE = _PROJECT_ROOT / ".env"
+_ENV_VALUE_INDEX = {"dev": 0, "staging": 1, "prod": 2}
 
 
 class Settings(BaseSettings):
@@ -38,6 +39,10 @@ class Settings(BaseSettings):
     tool_force_no_color_env: bool = True
     tool_hci_filter_executable: str = "publish/BluetoothKit.Console"
     tool_hci_filter_working_dir: str = "tools/bin"
+    tool_max_concurrency: int = Field(default=8, ge=1, le=1024)
+    tool_min_concurrency: int = Field(default=1, ge=1, le=1024)
+    tool_queue_timeout_seconds: float = Field(default=5.0, ge=0.0, le=600.0)
+    tool_target_latency_ms: int = Field(default=10000, ge=1)
 
     proxy_http: str | None = None
     proxy_https: str | None = None
@@ -58,6 +63,7 @@ class Settings(BaseSettings):
     jira_api_token_prod: str | None = None
     jira_timeout_seconds: float = Field(default=15.0, ge=1.0, le=120.0)
     jira_verify_ssl: bool = True
+    jira_warmup_on_startup: bool = True
 
     @field_validator("app_env")
     @classmethod
@@ -77,15 +83,21 @@ class Settings(BaseSettings):
             raise ValueError(f"log_level must be one of: {', '.join(sorted(allowed))}")
         return normalized
 
-    @property
+    @model_validator(mode="after")
+    def validate_tool_concurrency(self) -> Settings:
+        if self.tool_min_concurrency > self.tool_max_concurrency:
+            raise ValueError("tool_min_concurrency must not exceed tool_max_concurrency")
+        return self
+
+    @cached_property
     def project_root(self) -> Path:
         return get_project_root()
 
-    @property
+    @cached_property
     def resolved_tool_bin_dir(self) -> Path:
         return resolve_from_root(self.tool_bin_dir)
 
-    @property
+    @cached_property
     def resolved_log_level(self) -> str:
         if self.log_level != "AUTO":
             return self.log_level
@@ -97,19 +109,19 @@ class Settings(BaseSettings):
         }
         return default_by_env.get(self.app_env, "INFO")
 
-    @property
+    @cached_property
     def resolved_log_json(self) -> bool:
         if self.log_json is not None:
             return self.log_json
         return self.app_env in {"staging", "prod"}
 
-    @property
+    @cached_property
     def resolved_api_reload(self) -> bool:
         if self.app_env == "prod":
             return False
         return self.api_reload
 
-    @property
+    @cached_property
     def resolved_jira_base_url(self) -> str | None:
         value = self._select_env_value(
             dev=self.jira_base_url_dev,
@@ -118,7 +130,7 @@ class Settings(BaseSettings):
         )
         return value or self.jira_base_url
 
-    @property
+    @cached_property
     def resolved_jira_user_email(self) -> str | None:
         value = self._select_env_value(
             dev=self.jira_user_email_dev,
@@ -127,7 +139,7 @@ class Settings(BaseSettings):
         )
         return value or self.jira_user_email
 
-    @property
+    @cached_property
     def resolved_jira_api_token(self) -> str | None:
         value = self._select_env_value(
             dev=self.jira_api_token_dev,
@@ -144,6 +156,7 @@ class Settings(BaseSettings):
             and self.resolved_jira_api_token
         )
 
+    @cached_property
     def proxy_env(self) -> dict[str, str]:
         proxy_env: dict[str, str] = {}
         if self.proxy_http:
@@ -164,13 +177,10 @@ class Settings(BaseSettings):
         staging: str | None,
         prod: str | None,
     ) -> str | None:
-        if self.app_env == "dev":
-            return dev
-        if self.app_env == "staging":
-            return staging
-        if self.app_env == "prod":
-            return prod
-        return None
+        index = _ENV_VALUE_INDEX.get(self.app_env)
+        if index is None:
+            return None
+        return (dev, staging, prod)[index]
 
 
 @lru_cache(maxsize=1)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from bt_service.concurrency import AdaptiveConcurrencyLimiter, ConcurrencyLimitError
+
+
+def _limiter(**overrides: float) -> AdaptiveConcurrencyLimiter:
+    values: dict[str, float] = {
+        "min_limit": 1,
+        "max_limit": 4,
+        "target_latency_ms": 1000,
+        "queue_timeout_seconds": 0.05,
+    }
+    values.update(overrides)
+    return AdaptiveConcurrencyLimiter(**values)
+
+
+@pytest.mark.asyncio
+async def test_acquire_rejects_when_queue_timeout_expires() -> None:
+    limiter = _limiter(max_limit=1)
+
+    async with limiter.acquire():
+        with pytest.raises(ConcurrencyLimitError):
+            async with limiter.acquire():
+                pass
+
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limit_decreases_on_slow_calls_and_recovers() -> None:
+    limiter = _limiter(target_latency_ms=10)
+
+    async with limiter.acquire():
+        await asyncio.sleep(0.03)
+    assert limiter.limit == 2
+
+    for _ in range(10):
+        async with limiter.acquire():
+            pass
+    assert limiter.limit > 2
+
+
+@pytest.mark.asyncio
+async def test_burst_of_slow_calls_decreases_limit_once() -> None:
+    limiter = _limiter(max_limit=8, target_latency_ms=10)
+
+    for _ in range(3):
+        async with limiter.acquire():
+            await asyncio.sleep(0.03)
+
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_overloaded_slow_call_decreases_limit_once() -> None:
+    limiter = _limiter(max_limit=8, target_latency_ms=10)
+
+    async with limiter.acquire() as slot:
+        await asyncio.sleep(0.03)
+        slot.overloaded = True
+
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_overloaded_fast_call_decreases_limit() -> None:
+    limiter = _limiter(max_limit=8)
+
+    async with limiter.acquire() as slot:
+        slot.overloaded = True
+
+    assert limiter.limit == 4
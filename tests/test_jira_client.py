@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from bt_service.jira_client import (
+    JiraClient,
+    JiraConfigError,
+    JiraPayloadError,
+    JiraRuntimeConfig,
+)
+from bt_service.settings import Settings
+
+
+def _config(**overrides: object) -> JiraRuntimeConfig:
+    values: dict[str, object] = {
+        "app_env": "test",
+        "jira_base_url": "https://jira.example.com",
+        "jira_user_email": "bot@example.com",
+        "jira_api_token": "token",
+    }
+    values.update(overrides)
+    return JiraRuntimeConfig.from_settings(Settings(**values))
+
+
+@pytest.mark.asyncio
+async def test_update_issue_reuses_injected_client() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(204 if request.method == "PUT" else 201)
+
+    async with httpx.AsyncClient(
+        base_url="https://jira.example.com",
+        transport=httpx.MockTransport(handler),
+    ) as http_client:
+        client = JiraClient(_config(), http_client)
+        first = await client.update_issue("PROJ-1", {"summary": "a"}, None)
+        second = await client.update_issue("PROJ-2", {}, "done")
+        third = await client.update_issue("PROJ-3", {"summary": "b"}, "done")
+
+    assert first == {"issue_key": "PROJ-1", "fields_updated": True, "comment_added": False}
+    assert second == {"issue_key": "PROJ-2", "fields_updated": False, "comment_added": True}
+    assert third == {"issue_key": "PROJ-3", "fields_updated": True, "comment_added": True}
+    assert [(r.method, r.url.path) for r in requests] == [
+        ("PUT", "/rest/api/2/issue/PROJ-1"),
+        ("POST", "/rest/api/2/issue/PROJ-2/comment"),
+        ("PUT", "/rest/api/2/issue/PROJ-3"),
+    ]
+    assert json.loads(requests[0].content) == {"fields": {"summary": "a"}}
+    assert json.loads(requests[2].content) == {
+        "fields": {"summary": "b"},
+        "update": {"comment": [{"add": {"body": "done"}}]},
+    }
+    assert requests[0].headers["Authorization"].startswith("Basic ")
+
+
+@pytest.mark.asyncio
+async def test_update_issue_encodes_integers_beyond_64_bits() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(204)
+
+    value = 123456789012345678901234567890
+    async with httpx.AsyncClient(
+        base_url="https://jira.example.com",
+        transport=httpx.MockTransport(handler),
+    ) as http_client:
+        client = JiraClient(_config(), http_client)
+        await client.update_issue("PROJ-1", {"customfield_1": value}, None)
+
+    assert json.loads(requests[0].content) == {"fields": {"customfield_1": value}}
+
+
+@pytest.mark.asyncio
+async def test_update_issue_rejects_non_finite_numbers() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(204)
+
+    async with httpx.AsyncClient(
+        base_url="https://jira.example.com",
+        transport=httpx.MockTransport(handler),
+    ) as http_client:
+        client = JiraClient(_config(), http_client)
+        for value in (float("nan"), {"values": [1.0, float("inf")]}):
+            with pytest.raises(JiraPayloadError):
+                await client.update_issue("PROJ-1", {"customfield_1": value}, None)
+
+    assert requests == []
+
+
+@pytest.mark.asyncio
+async def test_update_issue_requires_configuration() -> None:
+    async with httpx.AsyncClient() as http_client:
+        client = JiraClient(_config(jira_api_token=None), http_client)
+        with pytest.raises(JiraConfigError):
+            await client.update_issue("PROJ-1", {"summary": "a"}, None)
+
+
+@pytest.mark.asyncio
+async def test_warm_up_skips_unconfigured_jira() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("no request expected")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        await JiraClient(_config(jira_base_url=None), http_client).warm_up()
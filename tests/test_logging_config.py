@@ -0,0 +1,37 @@
+import json
+import logging
+from datetime import UTC, datetime
+
+import orjson
+
+from bt_service.logging_config import JsonLogFormatter
+
+
+def test_json_formatter_timestamp_is_utc_iso() -> None:
+    formatter = JsonLogFormatter()
+    for created in (
+        1_700_000_000.25,
+        1_700_000_000.5,
+        1_700_000_001.0,
+        1_700_000_000.123457,
+        1_700_000_000.9999996,
+    ):
+        record = logging.LogRecord("bt_service", logging.INFO, __file__, 1, "hello", None, None)
+        record.created = created
+
+        payload = orjson.loads(formatter.format(record))
+
+        expected = datetime.fromtimestamp(created, UTC).isoformat(timespec="microseconds")
+        assert payload["timestamp"] == expected
+        assert payload["message"] == "hello"
+
+
+def test_json_formatter_keeps_records_with_lone_surrogates() -> None:
+    formatter = JsonLogFormatter()
+    record = logging.LogRecord(
+        "bt_service", logging.INFO, __file__, 1, "path=%s", ("/tmp/\udcff",), None
+    )
+
+    payload = json.loads(formatter.format(record))
+
+    assert payload["message"] == "path=/tmp/\udcff"
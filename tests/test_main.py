@@ -0,0 +1,199 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from bt_service.concurrency import AdaptiveConcurrencyLimiter, ConcurrencyLimitError
+from bt_service.jira_client import JiraClient, JiraRuntimeConfig
+from bt_service.main import (
+    _try_parse_json,
+    create_app,
+    get_jira_client,
+    get_runner,
+    get_tool_limiter,
+)
+from bt_service.process_runner import ProcessResult
+from bt_service.settings import Settings
+
+
+class _StubRunner:
+    def __init__(self, *results: ProcessResult) -> None:
+        self._results = list(results)
+
+    async def run_async(self, *args: Any, **kwargs: Any) -> ProcessResult:
+        result = self._results.pop(0) if len(self._results) > 1 else self._results[0]
+        await asyncio.sleep(result.duration_ms / 1000)
+        return result
+
+
+class _SaturatedLimiter:
+    limit = 1
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        raise ConcurrencyLimitError("Concurrency limit reached (1 running).")
+        yield
+
+
+def _limiter(target_latency_ms: float = 10_000) -> AdaptiveConcurrencyLimiter:
+    return AdaptiveConcurrencyLimiter(
+        min_limit=1, max_limit=4, target_latency_ms=target_latency_ms, queue_timeout_seconds=1
+    )
+
+
+def _client(*results: ProcessResult, limiter: Any = None) -> TestClient:
+    app = create_app()
+    runner = _StubRunner(*results)
+    app.dependency_overrides[get_runner] = lambda: runner
+    limiter = limiter or _limiter()
+    app.dependency_overrides[get_tool_limiter] = lambda: limiter
+    return TestClient(app)
+
+
+def _result(
+    stdout: bytes, exit_code: int = 0, timed_out: bool = False, duration_ms: int = 7
+) -> ProcessResult:
+    return ProcessResult(
+        command=["tool"],
+        exit_code=exit_code,
+        stdout_bytes=stdout,
+        stderr="",
+        duration_ms=duration_ms,
+        timed_out=timed_out,
+    )
+
+
+def test_try_parse_json_accepts_documents_with_whitespace() -> None:
+    assert _try_parse_json(b'\n  {"events": [1, 2]}\n') == {"events": [1, 2]}
+    assert _try_parse_json(b"[]") == []
+
+
+@pytest.mark.parametrize("content", [b"", b" \n", b"Error: file not found", b"42", b"{broken"])
+def test_try_parse_json_rejects_non_documents(content: bytes) -> None:
+    with pytest.raises(ValueError):
+        _try_parse_json(content)
+
+
+def test_try_parse_json_reads_integers_beyond_64_bits_as_float() -> None:
+    # orjson limitation, documented in the README.
+    assert _try_parse_json(b'{"n": 123456789012345678901234567890}') == {
+        "n": 1.2345678901234568e29
+    }
+
+
+def test_hci_filter_returns_parsed_output() -> None:
+    client = _client(_result(b'{"events": [1]}'))
+
+    response = client.post("/api/v1/tools/hci/filter", json={"input_path": "log"})
+
+    assert response.status_code == 200
+    assert response.json()["output"] == {"events": [1]}
+    assert response.json()["duration_ms"] == 7
+
+
+def test_hci_filter_raw_returns_stdout_and_metadata_headers() -> None:
+    stdout = b'{"events": [1, 2]}\n'
+    client = _client(_result(stdout))
+
+    response = client.post("/api/v1/tools/hci/filter?raw=true", json={"input_path": "log"})
+
+    assert response.status_code == 200
+    assert response.content == stdout
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["X-Exit-Code"] == "0"
+    assert response.headers["X-Duration-Ms"] == "7"
+
+
+def test_hci_filter_raw_rejects_non_json_stdout() -> None:
+    client = _client(_result(b"Error: file not found"))
+
+    response = client.post("/api/v1/tools/hci/filter?raw=true", json={"input_path": "log"})
+
+    assert response.status_code == 502
+
+
+def test_hci_filter_openapi_documents_raw_response() -> None:
+    operation = create_app().openapi()["paths"]["/api/v1/tools/hci/filter"]["post"]
+    ok = operation["responses"]["200"]
+
+    schemas = ok["content"]["application/json"]["schema"]["anyOf"]
+    assert {"$ref": "#/components/schemas/ToolExecutionResponse"} in schemas
+    assert {"type": "array", "items": {}} in schemas
+    assert set(ok["headers"]) == {"X-Exit-Code", "X-Duration-Ms"}
+
+
+def test_hci_filter_returns_503_when_concurrency_limit_is_reached() -> None:
+    client = _client(_result(b"{}"), limiter=_SaturatedLimiter())
+
+    response = client.post("/api/v1/tools/hci/filter", json={"input_path": "log"})
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_hci_filter_backs_off_only_on_timeouts() -> None:
+    limiter = _limiter(target_latency_ms=20)
+    client = _client(
+        _result(b"", exit_code=2),
+        _result(b"", exit_code=124, timed_out=True, duration_ms=50),
+        limiter=limiter,
+    )
+
+    failed = client.post("/api/v1/tools/hci/filter", json={"input_path": "missing"})
+    assert failed.status_code == 502
+    assert limiter.limit == 4
+
+    # The run is both over the latency target and timed out: one halving, not two.
+    timed_out = client.post("/api/v1/tools/hci/filter", json={"input_path": "log"})
+    assert timed_out.status_code == 502
+    assert limiter.limit == 2
+
+
+def test_jira_update_rejects_nan_in_fields() -> None:
+    app = create_app()
+    app.dependency_overrides[get_jira_client] = lambda: None
+    client = TestClient(app)
+
+    response = client.post(
+        "/api/v1/jira/issues/update",
+        content=b'{"issue_key": "PROJ-1", "fields": {"customfield_1": NaN}}',
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 422
+
+
+def test_jira_update_rejects_nan_in_fields() -> None:
+    sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(204)
+
+    config = JiraRuntimeConfig.from_settings(
+        Settings(
+            app_env="test",
+            jira_base_url="https://jira.example.com",
+            jira_user_email="bot@example.com",
+            jira_api_token="token",
+        )
+    )
+    http_client = httpx.AsyncClient(
+        base_url=config.base_url, transport=httpx.MockTransport(handler)
+    )
+    app = create_app()
+    app.dependency_overrides[get_jira_client] = lambda: JiraClient(config, http_client)
+    client = TestClient(app)
+
+    response = client.post(
+        "/api/v1/jira/issues/update",
+        content=b'{"issue_key": "PROJ-1", "fields": {"customfield_1": NaN}}',
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 422
+    assert sent == []
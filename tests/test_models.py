@@ -0,0 +1,13 @@
+import pytest
+from pydantic import ValidationError
+
+from bt_service.models import JiraIssueUpdateRequest
+
+
+def test_issue_key_format() -> None:
+    assert JiraIssueUpdateRequest(issue_key="PROJ-123", comment="x").issue_key == "PROJ-123"
+
+    for invalid in ("PROJ123", "1PROJ-1", "PROJ-12a", "PROJ-١٢"):
+        with pytest.raises(ValidationError) as exc_info:
+            JiraIssueUpdateRequest(issue_key=invalid, comment="x")
+        assert exc_info.value.errors()[0]["type"] == "string_pattern_mismatch"
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from bt_service import process_runner
+from bt_service.process_runner import (
+    ExecutableNotFoundError,
+    ProcessRunner,
+    UnsafeExecutablePathError,
+    _strip_ansi,
+    _strip_ansi_bytes,
+)
+from bt_service.settings import Settings
+
+
+def _write_tool(bin_dir: Path, name: str, body: str) -> None:
+    tool = bin_dir / name
+    tool.write_text(f"#!{sys.executable}\n{body}\n", encoding="utf-8")
+    tool.chmod(0o755)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("plain", "plain"),
+        ("\x1b[32mPASSED\x1b[0m done", "PASSED done"),
+        ("\x1b[1;31;40mX\x1b[2K", "X"),
+        ("cut \x1b[12", "cut \x1b[12"),
+        ("\x1b]0;title\x07", "\x1b]0;title\x07"),
+    ],
+)
+def test_strip_ansi_removes_complete_csi_sequences_only(value: str, expected: str) -> None:
+    assert _strip_ansi(value) == expected
+    assert _strip_ansi_bytes(value.encode("utf-8")) == expected.encode("utf-8")
+
+
+def test_run_keeps_stdout_bytes_without_ansi(tmp_path: Path) -> None:
+    _write_tool(tmp_path, "tool", 'print(\'{"ok": true}\')')
+    runner = ProcessRunner(Settings(tool_bin_dir=str(tmp_path)))
+
+    result = runner.run("tool", [], working_dir=str(tmp_path))
+
+    assert result.exit_code == 0
+    assert result.stdout == '{"ok": true}\n'
+    assert result.stdout_bytes == b'{"ok": true}\n'
+
+
+def test_run_strips_ansi_from_stdout_bytes(tmp_path: Path) -> None:
+    _write_tool(tmp_path, "tool", r'print("\x1b[31m[1]\x1b[0m")')
+    runner = ProcessRunner(Settings(tool_bin_dir=str(tmp_path), tool_strip_ansi_output=True))
+
+    result = runner.run("tool", [], working_dir=str(tmp_path))
+
+    assert result.stdout == "[1]\n"
+    assert result.stdout_bytes == b"[1]\n"
+
+
+def test_run_keeps_ansi_when_stripping_disabled(tmp_path: Path) -> None:
+    _write_tool(tmp_path, "tool", r'print("\x1b[31m[1]\x1b[0m")')
+    runner = ProcessRunner(Settings(tool_bin_dir=str(tmp_path), tool_strip_ansi_output=False))
+
+    result = runner.run("tool", [], working_dir=str(tmp_path))
+
+    assert result.stdout == "\x1b[31m[1]\x1b[0m\n"
+    assert result.stdout_bytes == b"\x1b[31m[1]\x1b[0m\n"
+
+
+def test_run_many_returns_results_in_spec_order(tmp_path: Path) -> None:
+    _write_tool(tmp_path, "tool", "import sys; print(sys.argv[1])")
+    runner = ProcessRunner(Settings(tool_bin_dir=str(tmp_path)))
+    specs = [
+        {"executable": "tool", "args": [str(index)], "working_dir": str(tmp_path)}
+        for index in range(5)
+    ]
+
+    results = runner.run_many(specs)
+
+    assert [result.stdout for result in results] == [f"{index}\n" for index in range(5)]
+    assert runner.run_many([]) == []
+
+
+def test_run_reports_timeout_with_partial_output(tmp_path: Path) -> None:
+    _write_tool(tmp_path, "tool", 'import time\nprint("started", flush=True)\ntime.sleep(5)')
+    runner = ProcessRunner(Settings(tool_bin_dir=str(tmp_path)))
+
+    result = runner.run("tool", [], timeout_seconds=1, working_dir=str(tmp_path))
+
+    assert result.exit_code == 124
+    assert result.timed_out
+    assert result.stdout == "started\n"
+    assert "timed out after 1 seconds" in result.stderr
+
+
+@pytest.mark.asyncio
+async def test_run_async_reports_timeout(tmp_path: Path) -> None:
+    _write_tool(
+        tmp_path,
+        "tool",
+        'import sys, time\nprint("started", flush=True)\n'
+        'print("err", file=sys.stderr, flush=True)\ntime.sleep(5)',
+    )
+    runner = ProcessRunner(Settings(tool_bin_dir=str(tmp_path)))
+
+    result = await runner.run_async("tool", [], timeout_seconds=1, working_dir=str(tmp_path))
+
+    assert result.exit_code == 124
+    assert result.timed_out
+    assert result.stdout == "started\n"
+    assert result.stderr.startswith("err\n")
+    assert "timed out after 1 seconds" in result.stderr
+
+
+def _write_tool_with_grandchild(bin_dir: Path, pid_file: Path) -> None:
+    _write_tool(
+        bin_dir,
+        "tool",
+        "import subprocess, sys, time\n"
+        'child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])\n'
+        f"open({str(pid_file)!r}, 'w').write(str(child.pid))\n"
+        'print("started", flush=True)\ntime.sleep(30)',
+    )
+
+
+def _is_dead(pid: int) -> bool:
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline:
+        try:
+            state = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()[0]
+        except FileNotFoundError:
+            return True
+        if state in ("Z", "X"):
+            return True
+        time.sleep(0.05)
+    return False
+
+
+@pytest.mark.skipif(not Path("/proc").is_dir(), reason="needs /proc")
+def test_run_timeout_kills_grandchildren_holding_pipes(tmp_path: Path) -> None:
+    pid_file = tmp_path / "grandchild.pid"
+    _write_tool_with_grandchild(tmp_path, pid_file)
+    runner = ProcessRunner(Settings(tool_bin_dir=str(tmp_path)))
+
+    result = runner.run("tool", [], timeout_seconds=1, working_dir=str(tmp_path))
+
+    assert result.timed_out
+    assert result.stdout == "started\n"
+    # The pipes close with the process group instead of waiting out the drain.
+    assert result.duration_ms < 1000 + process_runner._KILL_DRAIN_TIMEOUT_SECONDS * 900
+    assert _is_dead(int(pid_file.read_text()))
+
+
+@pytest.mark.skipif(not Path("/proc").is_dir(), reason="needs /proc")
+@pytest.mark.asyncio
+async def test_run_async_timeout_kills_grandchildren_holding_pipes(tmp_path: Path) -> None:
+    pid_file = tmp_path / "grandchild.pid"
+    _write_tool_with_grandchild(tmp_path, pid_file)
+    runner = ProcessRunner(Settings(tool_bin_dir=str(tmp_path)))
+
+    result = await runner.run_async("tool", [], timeout_seconds=1, working_dir=str(tmp_path))
+
+    assert result.timed_out
+    assert result.stdout == "started\n"
+    assert result.duration_ms < 1000 + process_runner._KILL_DRAIN_TIMEOUT_SECONDS * 900
+    assert _is_dead(int(pid_file.read_text()))
+
+
+@pytest.mark.skipif(not Path("/proc").is_dir(), reason="needs /proc")
+@pytest.mark.asyncio
+async def test_run_async_cancel_kills_grandchildren(tmp_path: Path) -> None:
+    pid_file = tmp_path / "grandchild.pid"
+    _write_tool_with_grandchild(tmp_path, pid_file)
+    runner = ProcessRunner(Settings(tool_bin_dir=str(tmp_path)))
+
+    task = asyncio.create_task(
+        runner.run_async("tool", [], timeout_seconds=30, working_dir=str(tmp_path))
+    )
+    for _ in range(100):
+        if pid_file.exists() and pid_file.read_text():
+            break
+        await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert _is_dead(int(pid_file.read_text()))
+
+
+def test_run_reports_executable_removed_after_resolution(tmp_path: Path) -> None:
+    (tmp_path / "publish").mkdir()
+    _write_tool(tmp_path / "publish", "tool", 'print("[]")')
+    runner = ProcessRunner(Settings(tool_bin_dir=str(tmp_path)))
+    assert runner.resolve_executable("publish/tool") == tmp_path / "publish" / "tool"
+
+    (tmp_path / "publish" / "tool").unlink()
+
+    with pytest.raises(ExecutableNotFoundError):
+        runner.run("publish/tool", [], working_dir=str(tmp_path))
+    with pytest.raises(ExecutableNotFoundError):
+        runner.resolve_executable("publish/tool")
+
+
+def test_resolve_executable_rejects_symlink_escaping_bin_dir(tmp_path: Path) -> None:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    _write_tool(tmp_path, "outside", 'print("[]")')
+    _write_tool(bin_dir, "tool", 'print("[]")')
+    (bin_dir / "link").symlink_to(tmp_path / "outside")
+    runner = ProcessRunner(Settings(tool_bin_dir=str(bin_dir)))
+
+    assert runner.resolve_executable("tool") == bin_dir / "tool"
+    with pytest.raises(UnsafeExecutablePathError):
+        runner.resolve_executable("link")
+    with pytest.raises(UnsafeExecutablePathError):
+        runner.resolve_executable("../outside")
+
+
+def test_resolve_executable_rejects_sibling_dir_sharing_prefix(tmp_path: Path) -> None:
+    bin_dir = tmp_path / "bin"
+    sibling = tmp_path / "bin2"
+    bin_dir.mkdir()
+    sibling.mkdir()
+    _write_tool(sibling, "tool", 'print("[]")')
+    runner = ProcessRunner(Settings(tool_bin_dir=str(bin_dir)))
+
+    with pytest.raises(UnsafeExecutablePathError):
+        runner.resolve_executable(str(sibling / "tool"))
+    with pytest.raises(UnsafeExecutablePathError):
+        runner.resolve_executable("../bin2/tool")
+
+
+def test_resolve_executable_rejects_cached_tool_swapped_for_symlink(tmp_path: Path) -> None:
+    bin_dir = tmp_path / "bin"
+    publish = bin_dir / "publish"
+    publish.mkdir(parents=True)
+    _write_tool(tmp_path, "outside", 'print("[]")')
+    _write_tool(publish, "tool", 'print("[]")')
+    runner = ProcessRunner(Settings(tool_bin_dir=str(bin_dir)))
+    assert runner.resolve_executable("publish/tool") == publish / "tool"
+
+    (publish / "tool").unlink()
+    (publish / "tool").symlink_to(tmp_path / "outside")
+
+    with pytest.raises(UnsafeExecutablePathError):
+        runner.resolve_executable("publish/tool")
+
+
+def test_resolve_executable_rejects_cached_dir_swapped_for_symlink(tmp_path: Path) -> None:
+    bin_dir = tmp_path / "bin"
+    nested = bin_dir / "a" / "publish"
+    nested.mkdir(parents=True)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    _write_tool(outside, "tool", 'print("[]")')
+    _write_tool(nested, "tool", 'print("[]")')
+    runner = ProcessRunner(Settings(tool_bin_dir=str(bin_dir)))
+    assert runner.resolve_executable("a/publish/tool") == nested / "tool"
+
+    (nested / "tool").unlink()
+    nested.rmdir()
+    nested.symlink_to(outside)
+
+    with pytest.raises(UnsafeExecutablePathError):
+        runner.resolve_executable("a/publish/tool")
+
+
+def test_resolve_executable_follows_retargeted_symlink_dir(tmp_path: Path) -> None:
+    bin_dir = tmp_path / "bin"
+    pub = bin_dir / "pub"
+    for version in ("v1", "v2"):
+        (pub / version).mkdir(parents=True)
+        _write_tool(pub / version, "tool", f'print("{version}")')
+    (pub / "cur").symlink_to("v1")
+    runner = ProcessRunner(Settings(tool_bin_dir=str(bin_dir)))
+    assert runner.run("pub/cur/tool", [], working_dir=str(tmp_path)).stdout == "v1\n"
+
+    (pub / "next").symlink_to("v2")
+    (pub / "next").replace(pub / "cur")
+
+    assert runner.resolve_executable("pub/cur/tool") == pub / "v2" / "tool"
+    assert runner.run("pub/cur/tool", [], working_dir=str(tmp_path)).stdout == "v2\n"
@@ -1,3 +1,6 @@
+import pytest
+from pydantic import ValidationError
+
 from bt_service.settings import Settings
 
 
@@ -36,3 +39,20 @@ def test_jira_env_specific_overrides() -> None:
     assert settings.resolved_jira_base_url == "https://staging.example.com"
     assert settings.resolved_jira_user_email == "staging@example.com"
     assert settings.resolved_jira_api_token == "staging-token"
+
+
+def test_jira_test_env_uses_global_values() -> None:
+    settings = Settings(
+        app_env="test",
+        jira_base_url="https://fallback.example.com",
+        jira_base_url_dev="https://dev.example.com",
+    )
+
+    assert settings.resolved_jira_base_url == "https://fallback.example.com"
+
+
+def test_tool_concurrency_bounds_are_validated() -> None:
+    assert Settings(tool_min_concurrency=4, tool_max_concurrency=4).tool_min_concurrency == 4
+
+    with pytest.raises(ValidationError):
+        Settings(tool_min_concurrency=5, tool_max_concurrency=4)